@@ -19,6 +19,17 @@ except ImportError as e:
 
 
 class AHKMouseController(AbstractMouseController):
+    """
+    Mouse controller implementation using AutoHotkey.
+
+    By default every point is moved with its own ``mouse_move`` call. If
+    ``bulk_min_points`` is given, ``move_to_target`` sends paths of at
+    least that many points to AutoHotkey as one script instead.
+    ``AHK.run_script`` starts a new AutoHotkey process for that script, so
+    the settings and directives of the given AHK instance do not apply to
+    it.
+    """
+
     def __init__(
         self,
         ahk: AHK[Any],
@@ -31,8 +42,24 @@ class AHKMouseController(AbstractMouseController):
         wind_magnitude: float = WIND_MAGNITUDE_DEFAULT,
         max_step: float = MAX_STEP_DEFAULT,
         damped_distance: float = DAMPED_DISTANCE_DEFAULT,
+        bulk_min_points: int | None = None,
     ):
+        """
+        Initialize AHK mouse controller.
+
+        See :py:meth:`core.AbstractMouseController.__init__` for the
+        arguments shared with other controllers.
+
+        Args:
+            ahk: AHK instance used to move the mouse.
+            bulk_min_points: Minimal number of remaining points for
+                ``move_to_target`` to send the path as a single script.
+                The path is always moved point by point if None.
+        """
         self._ahk = ahk
+        self._bulk_min_points = bulk_min_points
+        self._mouse_move = ahk.mouse_move
+        self._get_mouse_position = ahk.get_mouse_position
         super().__init__(
             start_x,
             start_y,
@@ -48,16 +75,66 @@ class AHKMouseController(AbstractMouseController):
         coords = self._get_next_point()
         if coords is None:
             return False
-        self._ahk.mouse_move(
+        self._mouse_move(
             coords[0], coords[1], speed=step_duration, coord_mode="Screen"
         )  # type: ignore[call-overload]
         return True
 
+    def _move_along_path(
+        self, tick_delay: float, step_duration: float
+    ) -> None:
+        self._precompute_path()
+        remaining = self._path[self._idx :]
+        if (
+            self._bulk_min_points is None
+            or len(remaining) < self._bulk_min_points
+        ):
+            super()._move_along_path(tick_delay, step_duration)
+            return
+        self._send_path_bulk(remaining, step_duration, tick_delay)
+        self._idx = len(self._path)
+
+    def _send_path_bulk(
+        self,
+        path: list[tuple[Coordinate, Coordinate]],
+        step_duration: float,
+        tick_delay: float,
+    ) -> None:
+        """
+        Move through all points of the path with a single AHK script run
+
+        The script runs in a new AutoHotkey process, so it pays the
+        process start-up cost once instead of one daemon call per point.
+
+        Args:
+            path: x, y points to move through
+            step_duration: AHK mouse speed for each step
+            tick_delay: Sleep time between steps (in seconds)
+        """
+        # get_major_version only exists since ahk 1.4.0, older ones are v1
+        get_major_version = getattr(
+            self._ahk, "get_major_version", lambda: "v1"
+        )
+        if get_major_version() == "v2":
+            lines = ['CoordMode "Mouse", "Screen"']
+        else:
+            lines = ["CoordMode, Mouse, Screen"]
+        sleep = f"Sleep {round(tick_delay * 1000)}" if tick_delay > 0 else ""
+        for x, y in path:
+            lines.append(f"MouseMove {x}, {y}, {step_duration}")
+            if sleep:
+                lines.append(sleep)
+        self._ahk.run_script("\n".join(lines))
+
     def _get_current_mouse_x(self) -> Coordinate:
-        return Coordinate(self._ahk.get_mouse_position(coord_mode="Screen")[0])
+        return Coordinate(self._get_mouse_position(coord_mode="Screen")[0])
 
     def _get_current_mouse_y(self) -> Coordinate:
-        return Coordinate(self._ahk.get_mouse_position(coord_mode="Screen")[1])
+        return Coordinate(self._get_mouse_position(coord_mode="Screen")[1])
+
+    def _get_current_mouse_position(self) -> tuple[Coordinate, Coordinate]:
+        x, y = self._get_mouse_position(coord_mode="Screen")
+        return Coordinate(x), Coordinate(y)
 
     def _hold_mouse_button(self, button: HoldMouseButton) -> None:
         self._ahk.click(button=button.value, direction="D")
@@ -3,11 +3,30 @@
 from __future__ import annotations
 
 import enum
+import random
 import time
 from abc import ABC, abstractmethod
-from typing import Generator, NewType
+from math import hypot, sqrt
+from typing import Any, Callable, Generator, NewType, TypeVar, cast
 
 import numpy as np
+import numpy.typing as npt
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional dependency
+    _F = TypeVar("_F", bound=Callable[..., Any])
+
+    def njit(  # type: ignore[no-redef]
+        *_args: Any, **_kwargs: Any
+    ) -> Callable[[_F], _F]:
+        """Fallback for numba.njit which leaves the function as is."""
+
+        def decorator(func: _F) -> _F:
+            return func
+
+        return decorator
+
 
 GRAVITY_MAGNITUDE_DEFAULT = 9
 WIND_MAGNITUDE_DEFAULT = 3
@@ -16,8 +35,122 @@ DAMPED_DISTANCE_DEFAULT = 12
 
 Coordinate = NewType("Coordinate", int)
 
-sqrt3 = np.sqrt(3)
-sqrt5 = np.sqrt(5)
+sqrt3 = sqrt(3)
+sqrt5 = sqrt(5)
+
+
+@njit(cache=True)
+def _wind_mouse_path(
+    start_x: float,
+    start_y: float,
+    dest_x: float,
+    dest_y: float,
+    gravity_magnitude: float,
+    wind_magnitude: float,
+    max_step: float,
+    damped_distance: float,
+    seed: int,
+) -> list[tuple[int, int]]:
+    """
+    Compute the whole WindMouse path in one call.
+
+    Compiled to machine code with numba when it is installed.
+    See :py:func:`wind_mouse` for the meaning of the arguments, which
+    must be Python floats: NumPy scalars would make every operation in
+    the pure-Python fallback go through NumPy's slower scalar math.
+    A negative seed leaves the random state untouched. Seeding happens
+    here because numba keeps its own random state, which Python's
+    ``random.seed()`` does not reach.
+
+    Return:
+        List of x,y points the cursor passes through
+    """
+    # Local aliases keep the pure-Python fallback on fast local lookups
+    _hypot, _sqrt, _random, _round = hypot, sqrt, random.random, round
+    _sqrt3, _sqrt5 = sqrt3, sqrt5
+    if seed >= 0:
+        random.seed(seed)
+    path = []
+    current_x, current_y = start_x, start_y
+    velocity_x = velocity_y = wind_x = wind_y = 0.0
+    delta_x, delta_y = dest_x - start_x, dest_y - start_y
+    # dist >= 1 <=> dist**2 >= 1, so the sqrt is only taken inside the loop
+    dist_sq = delta_x * delta_x + delta_y * delta_y
+    while dist_sq >= 1:
+        dist = _sqrt(dist_sq)
+        wind_magnitude_current = min(wind_magnitude, dist)
+        if dist >= damped_distance:
+            wind_x = (
+                wind_x / _sqrt3
+                + (2 * _random() - 1) * wind_magnitude_current / _sqrt5
+            )
+            wind_y = (
+                wind_y / _sqrt3
+                + (2 * _random() - 1) * wind_magnitude_current / _sqrt5
+            )
+        else:
+            wind_x /= _sqrt3
+            wind_y /= _sqrt3
+            if max_step < 3:
+                max_step = _random() * 3 + 3
+            else:
+                max_step /= _sqrt5
+        gravity_scale = gravity_magnitude / dist
+        velocity_x += wind_x + gravity_scale * delta_x
+        velocity_y += wind_y + gravity_scale * delta_y
+        velocity_magnitude = _hypot(velocity_x, velocity_y)
+        if velocity_magnitude > max_step:
+            velocity_clip = max_step / 2 + _random() * max_step / 2
+            velocity_scale = velocity_clip / velocity_magnitude
+            velocity_x *= velocity_scale
+            velocity_y *= velocity_scale
+        start_x += velocity_x
+        start_y += velocity_y
+        move_x = _round(start_x)
+        move_y = _round(start_y)
+        if current_x != move_x or current_y != move_y:
+            current_x, current_y = start_x, start_y
+            path.append((move_x, move_y))
+        delta_x, delta_y = dest_x - start_x, dest_y - start_y
+        dist_sq = delta_x * delta_x + delta_y * delta_y
+    return path
+
+
+def _compute_path(
+    start_x: float,
+    start_y: float,
+    dest_x: float,
+    dest_y: float,
+    gravity_magnitude: float,
+    wind_magnitude: float,
+    max_step: float,
+    damped_distance: float,
+    seed: int | None = None,
+) -> list[tuple[Coordinate, Coordinate]]:
+    """
+    Coerce the arguments to Python floats and compute the whole path.
+
+    See :py:func:`wind_mouse` for the meaning of the arguments.
+
+    Return:
+        List of x,y points the cursor passes through
+    """
+    # numba seeds from a 32-bit value, so larger seeds would be truncated
+    if seed is not None and not 0 <= seed < 2**32:
+        raise ValueError("seed must be in range [0, 2**32).")
+    path = _wind_mouse_path(
+        float(start_x),
+        float(start_y),
+        float(dest_x),
+        float(dest_y),
+        float(gravity_magnitude),
+        float(wind_magnitude),
+        float(max_step),
+        float(damped_distance),
+        -1 if seed is None else seed,
+    )
+    # Coordinate is a NewType over int, so the points need no wrapping
+    return cast("list[tuple[Coordinate, Coordinate]]", path)
 
 
 def wind_mouse(
@@ -29,6 +162,7 @@ def wind_mouse(
     wind_magnitude: float = WIND_MAGNITUDE_DEFAULT,
     max_step: float = MAX_STEP_DEFAULT,
     damped_distance: float = DAMPED_DISTANCE_DEFAULT,
+    seed: int | None = None,
 ) -> Generator[tuple[Coordinate, Coordinate], None, None]:
     """
     WindMouse algorithm.
@@ -42,43 +176,151 @@ def wind_mouse(
         wind_magnitude: magnitude of the wind force fluctuations
         max_step: maximum step size (velocity clip threshold)
         damped_distance: distance where wind behavior changes from random to damped
+        seed: seed for the wind fluctuations in range [0, 2**32), to
+            reproduce a path. Passing it re-seeds the global random state
+            (Python's ``random`` module, or numba's own one when numba is
+            installed), which affects other users of that state.
     Return:
         Generator which yields current x,y coordinates
     """
-    current_x, current_y = start_x, start_y
-    velocity_x = velocity_y = wind_x = wind_y = 0
-    while (dist := np.hypot(dest_x - start_x, dest_y - start_y)) >= 1:
-        wind_magnitude_current = min(wind_magnitude, dist)
-        if dist >= damped_distance:
-            wind_x = (
-                wind_x / sqrt3
-                + (2 * np.random.random() - 1) * wind_magnitude_current / sqrt5
-            )
-            wind_y = (
-                wind_y / sqrt3
-                + (2 * np.random.random() - 1) * wind_magnitude_current / sqrt5
-            )
-        else:
-            wind_x /= sqrt3
-            wind_y /= sqrt3
-            if max_step < 3:
-                max_step = np.random.random() * 3 + 3
-            else:
-                max_step /= sqrt5
-        velocity_x += wind_x + gravity_magnitude * (dest_x - start_x) / dist
-        velocity_y += wind_y + gravity_magnitude * (dest_y - start_y) / dist
-        velocity_magnitude = np.hypot(velocity_x, velocity_y)
-        if velocity_magnitude > max_step:
-            velocity_clip = max_step / 2 + np.random.random() * max_step / 2
-            velocity_x = (velocity_x / velocity_magnitude) * velocity_clip
-            velocity_y = (velocity_y / velocity_magnitude) * velocity_clip
-        start_x += velocity_x
-        start_y += velocity_y
-        move_x = int(np.round(start_x))
-        move_y = int(np.round(start_y))
-        if current_x != move_x or current_y != move_y:
-            current_x, current_y = start_x, start_y
-            yield Coordinate(move_x), Coordinate(move_y)
+    yield from _compute_path(
+        start_x,
+        start_y,
+        dest_x,
+        dest_y,
+        gravity_magnitude,
+        wind_magnitude,
+        max_step,
+        damped_distance,
+        seed,
+    )
+
+
+def wind_mouse_batch(
+    starts: npt.ArrayLike,
+    dests: npt.ArrayLike,
+    gravity_magnitude: float = GRAVITY_MAGNITUDE_DEFAULT,
+    wind_magnitude: float = WIND_MAGNITUDE_DEFAULT,
+    max_step: float = MAX_STEP_DEFAULT,
+    damped_distance: float = DAMPED_DISTANCE_DEFAULT,
+    seed: int | None = None,
+    rng: np.random.Generator | None = None,
+) -> list[npt.NDArray[np.int32]]:
+    """
+    WindMouse algorithm for many paths at once.
+
+    All paths are stepped together as NumPy arrays. Without numba this is
+    much faster than calling :py:func:`wind_mouse` in a loop when
+    generating lots of paths (e.g. for sampling or offline simulation).
+    With numba installed, the compiled :py:func:`wind_mouse` can be as
+    fast or faster, so measure before switching.
+
+    Args:
+        starts: start points, array-like of shape (B, 2).
+        dests: destination points, array-like of shape (B, 2).
+        gravity_magnitude: See :py:func:`wind_mouse`
+        wind_magnitude: See :py:func:`wind_mouse`
+        max_step: See :py:func:`wind_mouse`
+        damped_distance: See :py:func:`wind_mouse`
+        seed: non-negative seed for the wind fluctuations, to reproduce
+            the paths. Unlike :py:func:`wind_mouse`, it seeds a new
+            ``np.random.default_rng(seed)`` and leaves global state alone.
+        rng: random generator for wind fluctuations, as an alternative to
+            ``seed``. A fresh ``np.random.default_rng(seed)`` is used if
+            None.
+    Return:
+        List of B int32 arrays of shape (N, 2), one path per start point
+
+    Raises:
+        ValueError: If starts and dests are not both of shape (B, 2),
+            or if both seed and rng are given
+    """
+    start = np.asarray(starts, dtype=np.float64)
+    dest = np.asarray(dests, dtype=np.float64)
+    if start.ndim != 2 or start.shape[1] != 2 or start.shape != dest.shape:
+        raise ValueError("starts and dests must both have shape (B, 2).")
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    elif seed is not None:
+        raise ValueError("seed and rng cannot be given together.")
+
+    lanes = len(start)
+    position_x, position_y = start[:, 0].copy(), start[:, 1].copy()
+    dest_x, dest_y = dest[:, 0], dest[:, 1]
+    current_x, current_y = position_x.copy(), position_y.copy()
+    velocity_x, velocity_y = np.zeros(lanes), np.zeros(lanes)
+    wind_x, wind_y = np.zeros(lanes), np.zeros(lanes)
+    max_steps = np.full(lanes, float(max_step))
+
+    emitted_lanes = []
+    emitted_points = []
+    while True:
+        dist = np.hypot(dest_x - position_x, dest_y - position_y)
+        (active,) = np.nonzero(dist >= 1)
+        if active.size == 0:
+            break
+        dist = dist[active]
+        delta_x = dest_x[active] - position_x[active]
+        delta_y = dest_y[active] - position_y[active]
+
+        wind_magnitude_current = np.minimum(wind_magnitude, dist)
+        far = dist >= damped_distance
+        near = ~far
+        lane_wind_x = wind_x[active] / sqrt3
+        lane_wind_y = wind_y[active] / sqrt3
+        lane_wind_x[far] += (
+            (2 * rng.random(far.sum()) - 1)
+            * wind_magnitude_current[far]
+            / sqrt5
+        )
+        lane_wind_y[far] += (
+            (2 * rng.random(far.sum()) - 1)
+            * wind_magnitude_current[far]
+            / sqrt5
+        )
+        lane_max_step = max_steps[active]
+        reset = near & (lane_max_step < 3)
+        lane_max_step[near & ~reset] /= sqrt5
+        lane_max_step[reset] = rng.random(reset.sum()) * 3 + 3
+
+        gravity_scale = gravity_magnitude / dist
+        lane_velocity_x = velocity_x[active] + lane_wind_x
+        lane_velocity_x += gravity_scale * delta_x
+        lane_velocity_y = velocity_y[active] + lane_wind_y
+        lane_velocity_y += gravity_scale * delta_y
+        velocity_magnitude = np.hypot(lane_velocity_x, lane_velocity_y)
+        clip = velocity_magnitude > lane_max_step
+        clip_step = lane_max_step[clip]
+        velocity_clip = clip_step / 2 + rng.random(clip.sum()) * clip_step / 2
+        velocity_scale = velocity_clip / velocity_magnitude[clip]
+        lane_velocity_x[clip] *= velocity_scale
+        lane_velocity_y[clip] *= velocity_scale
+
+        lane_x = position_x[active] + lane_velocity_x
+        lane_y = position_y[active] + lane_velocity_y
+        move_x = np.rint(lane_x)
+        move_y = np.rint(lane_y)
+        emit = (current_x[active] != move_x) | (current_y[active] != move_y)
+        emitted_lanes.append(active[emit])
+        emitted_points.append(np.column_stack((move_x[emit], move_y[emit])))
+
+        current_x[active[emit]] = lane_x[emit]
+        current_y[active[emit]] = lane_y[emit]
+        position_x[active], position_y[active] = lane_x, lane_y
+        velocity_x[active], velocity_y[active] = (
+            lane_velocity_x,
+            lane_velocity_y,
+        )
+        wind_x[active], wind_y[active] = lane_wind_x, lane_wind_y
+        max_steps[active] = lane_max_step
+
+    if not emitted_lanes:
+        return [np.empty((0, 2), dtype=np.int32) for _ in range(lanes)]
+    point_lanes = np.concatenate(emitted_lanes)
+    order = np.argsort(point_lanes, kind="stable")
+    points = np.concatenate(emitted_points).astype(np.int32)[order]
+    counts = np.bincount(point_lanes, minlength=lanes)
+    return np.split(points, np.cumsum(counts)[:-1])
 
 
 class HoldMouseButton(enum.Enum):
@@ -93,7 +335,7 @@ class AbstractMouseController(ABC):
     Abstract Mouse controller class.
     """
 
-    _create_generator: bool
+    _create_path: bool
 
     def __init__(
         self,
@@ -131,7 +373,7 @@ class AbstractMouseController(ABC):
         self._max_step = max_step
         self._damped_distance = damped_distance
 
-        self._create_generator = True
+        self._create_path = True
 
     def move_to_target(
         self,
@@ -151,10 +393,8 @@ class AbstractMouseController(ABC):
         if hold_button != HoldMouseButton.NONE:
             self._hold_mouse_button(hold_button)
 
-        self._create_generator = True
-
-        while self.tick(step_duration):
-            time.sleep(tick_delay)
+        self._create_path = True
+        self._move_along_path(tick_delay, step_duration)
 
         if hold_button != HoldMouseButton.NONE:
             self._release_mouse_button(hold_button)
@@ -170,7 +410,7 @@ class AbstractMouseController(ABC):
     @start_x.setter
     def start_x(self, value: Coordinate | None) -> None:
         self._start_x = value
-        self._create_generator = True
+        self._create_path = True
 
     @property
     def start_y(self) -> Coordinate | None:
@@ -183,7 +423,7 @@ class AbstractMouseController(ABC):
     @start_y.setter
     def start_y(self, value: Coordinate | None) -> None:
         self._start_y = value
-        self._create_generator = True
+        self._create_path = True
 
     @property
     def start_position(self) -> tuple[Coordinate | None, Coordinate | None]:
@@ -206,7 +446,7 @@ class AbstractMouseController(ABC):
     @dest_x.setter
     def dest_x(self, value: Coordinate) -> None:
         self._dest_x = value
-        self._create_generator = True
+        self._create_path = True
 
     @property
     def dest_y(self) -> Coordinate | None:
@@ -218,7 +458,7 @@ class AbstractMouseController(ABC):
     @dest_y.setter
     def dest_y(self, value: Coordinate) -> None:
         self._dest_y = value
-        self._create_generator = True
+        self._create_path = True
 
     @property
     def dest_position(self) -> tuple[Coordinate | None, Coordinate | None]:
@@ -231,53 +471,73 @@ class AbstractMouseController(ABC):
     def dest_position(self, value: tuple[Coordinate, Coordinate]) -> None:
         self.dest_x, self.dest_y = value
 
-    def _recreate_generator(self) -> None:
+    def _precompute_path(self) -> None:
         """
-        Recreate generator if needed
+        Precompute the whole path if needed
 
         If start coordinates are not set, get current mouse coordinates.
 
         Raises:
             ValueError: If destination coordinates are not set
         """
-        if not self._create_generator:
+        if not self._create_path:
             return
-        self._start_x = self._start_x or self._get_current_mouse_x()
-        self._start_y = self._start_y or self._get_current_mouse_y()
+        if not self._start_x or not self._start_y:
+            current_x, current_y = self._get_current_mouse_position()
+            self._start_x = self._start_x or current_x
+            self._start_y = self._start_y or current_y
 
         if self._dest_x is None or self._dest_y is None:
             raise ValueError(
-                "Destination coordinates must be set before creating generator."
+                "Destination coordinates must be set "
+                "before computing the path."
             )
 
-        self._generator = (  # pylint: disable=attribute-defined-outside-init
-            wind_mouse(
-                self._start_x,
-                self._start_y,
-                self._dest_x,
-                self._dest_y,
-                self._gravity_magnitude,
-                self._wind_magnitude,
-                self._max_step,
-                self._damped_distance,
-            )
+        # pylint: disable=attribute-defined-outside-init
+        self._path = _compute_path(
+            self._start_x,
+            self._start_y,
+            self._dest_x,
+            self._dest_y,
+            self._gravity_magnitude,
+            self._wind_magnitude,
+            self._max_step,
+            self._damped_distance,
         )
-        self._create_generator = False
+        self._idx = 0
+        self._create_path = False
 
     def _get_next_point(self) -> tuple[Coordinate, Coordinate] | None:
         """
-        Get next point from generator
+        Get next point of the precomputed path
 
-        If needed, recreate generator.
+        If needed, precompute the path first.
 
         Returns:
-            Tuple of x, y coordinates or None if generator is exhausted
+            Tuple of x, y coordinates or None if the path is exhausted
         """
-        self._recreate_generator()
-        try:
-            return next(self._generator)
-        except StopIteration:
+        self._precompute_path()
+        if self._idx >= len(self._path):
             return None
+        point = self._path[self._idx]
+        self._idx += 1
+        return point
+
+    def _move_along_path(
+        self, tick_delay: float, step_duration: float
+    ) -> None:
+        """
+        Move the cursor through the rest of the path
+
+        Calls :py:meth:`tick` until the path is exhausted. Backends which
+        can send many points at once may override this.
+
+        Args:
+            tick_delay: See :py:meth:`move_to_target`
+            step_duration: See :py:meth:`move_to_target`
+        """
+        while self.tick(step_duration):
+            time.sleep(tick_delay)
 
     @abstractmethod
     def tick(self, step_duration: float = 0.1) -> bool:
@@ -326,6 +586,15 @@ class AbstractMouseController(ABC):
         Get current mouse y coordinate
         """
 
+    def _get_current_mouse_position(self) -> tuple[Coordinate, Coordinate]:
+        """
+        Get current mouse x, y coordinates
+
+        Backends which can read both coordinates in one call should
+        override this to avoid querying the mouse position twice.
+        """
+        return self._get_current_mouse_x(), self._get_current_mouse_y()
+
 
 __all__ = [
     "AbstractMouseController",
@@ -336,4 +605,5 @@ __all__ = [
     "MAX_STEP_DEFAULT",
     "DAMPED_DISTANCE_DEFAULT",
     "wind_mouse",
+    "wind_mouse_batch",
 ]
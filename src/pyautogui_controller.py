@@ -26,6 +26,10 @@ class PyautoguiMouseController(AbstractMouseController):
     def _get_current_mouse_y(self) -> Coordinate:
         return Coordinate(pyautogui.position().y)
 
+    def _get_current_mouse_position(self) -> tuple[Coordinate, Coordinate]:
+        position = pyautogui.position()
+        return Coordinate(position.x), Coordinate(position.y)
+
     def _hold_mouse_button(self, button: HoldMouseButton) -> None:
         pyautogui.mouseDown(button=button.value)
 
@@ -27,6 +27,23 @@ class TestAHKMouseController:
         assert controller.dest_y == 200
         assert controller._ahk == mock_ahk
 
+    def test_keeps_ahk_coord_mode(self):
+        """Test that the shared AHK coord mode is left untouched."""
+
+        mock_ahk = Mock()
+        mock_ahk.get_mouse_position.return_value = (0, 0)
+
+        controller = AHKMouseController(
+            ahk=mock_ahk,
+            start_x=Coordinate(0),
+            start_y=Coordinate(0),
+            dest_x=Coordinate(50),
+            dest_y=Coordinate(50),
+        )
+        controller.move_to_target(tick_delay=0, step_duration=0.01)
+
+        assert not mock_ahk.set_coord_mode.called
+
     def test_tick_moves_mouse(self):
         """Test that tick calls AHK mouse_move."""
 
@@ -67,6 +84,23 @@ class TestAHKMouseController:
         for call in mock_ahk.get_mouse_position.call_args_list:
             assert call[1]["coord_mode"] == "Screen"
 
+    def test_start_position_uses_single_query(self):
+        """Test that a missing start position is read with one AHK call."""
+
+        mock_ahk = Mock()
+        mock_ahk.get_mouse_position.return_value = (150, 250)
+
+        controller = AHKMouseController(
+            ahk=mock_ahk, dest_x=Coordinate(300), dest_y=Coordinate(300)
+        )
+
+        controller.tick()
+
+        assert controller.start_position == (150, 250)
+        mock_ahk.get_mouse_position.assert_called_once_with(
+            coord_mode="Screen"
+        )
+
     def test_hold_mouse_button(self):
         """Test holding mouse button."""
 
@@ -97,18 +131,100 @@ class TestAHKMouseController:
         mock_ahk = Mock()
         mock_ahk.get_mouse_position.return_value = (0, 0)
 
+        controller = AHKMouseController(
+            ahk=mock_ahk,
+            start_x=Coordinate(0),
+            start_y=Coordinate(0),
+            dest_x=Coordinate(800),
+            dest_y=Coordinate(600),
+        )
+
+        controller.move_to_target(tick_delay=0, step_duration=0.01)
+
+        # Bulk scripts are opt-in, so even long paths move point by point
+        assert mock_ahk.mouse_move.call_count == len(controller._path)
+        assert not mock_ahk.run_script.called
+
+    def test_move_to_target_bulk_script(self):
+        """Test that long enough paths are sent as a single script."""
+
+        mock_ahk = Mock()
+        mock_ahk.get_mouse_position.return_value = (0, 0)
+
+        controller = AHKMouseController(
+            ahk=mock_ahk,
+            start_x=Coordinate(0),
+            start_y=Coordinate(0),
+            dest_x=Coordinate(30),
+            dest_y=Coordinate(30),
+            bulk_min_points=1,
+        )
+
+        controller.move_to_target(tick_delay=0, step_duration=0.01)
+
+        # Whole path should be sent as a single script
+        mock_ahk.run_script.assert_called_once()
+        script = mock_ahk.run_script.call_args[0][0]
+        lines = script.split("\n")
+        assert lines[0] == "CoordMode, Mouse, Screen"
+        moves = [line for line in lines if line.startswith("MouseMove")]
+        assert len(moves) == len(controller._path)
+        assert moves[-1] == "MouseMove {}, {}, 0.01".format(
+            *controller._path[-1]
+        )
+        assert "Sleep" not in script
+        assert not mock_ahk.mouse_move.called
+        assert controller.tick() is False
+
+    def test_move_to_target_v2_script_with_delay(self):
+        """Test bulk script syntax for AHK v2 and tick delay sleeps."""
+
+        mock_ahk = Mock()
+        mock_ahk.get_mouse_position.return_value = (0, 0)
+        mock_ahk.get_major_version.return_value = "v2"
+
+        controller = AHKMouseController(
+            ahk=mock_ahk,
+            start_x=Coordinate(0),
+            start_y=Coordinate(0),
+            dest_x=Coordinate(30),
+            dest_y=Coordinate(30),
+            bulk_min_points=1,
+        )
+
+        controller.move_to_target(tick_delay=0.02, step_duration=2)
+
+        script = mock_ahk.run_script.call_args[0][0]
+        lines = script.split("\n")
+        assert lines[0] == 'CoordMode "Mouse", "Screen"'
+        assert lines.count("Sleep 20") == len(controller._path)
+
+    def test_move_to_target_bulk_script_without_major_version(self):
+        """Test v1 bulk script for ahk versions without get_major_version."""
+
+        mock_ahk = Mock(
+            spec=[
+                "mouse_move",
+                "get_mouse_position",
+                "click",
+                "run_script",
+            ]
+        )
+        mock_ahk.get_mouse_position.return_value = (0, 0)
+
         controller = AHKMouseController(
             ahk=mock_ahk,
             start_x=Coordinate(0),
             start_y=Coordinate(0),
             dest_x=Coordinate(30),
             dest_y=Coordinate(30),
+            bulk_min_points=1,
         )
 
         controller.move_to_target(tick_delay=0, step_duration=0.01)
 
-        # Should have called mouse_move at least once
-        assert mock_ahk.mouse_move.call_count > 0
+        script = mock_ahk.run_script.call_args[0][0]
+        assert script.split("\n")[0] == "CoordMode, Mouse, Screen"
 
     def test_move_with_drag(self):
         """Test movement with button held (drag)."""
@@ -7,7 +7,9 @@ from windmouse.core import (
     AbstractMouseController,
     Coordinate,
     HoldMouseButton,
+    _wind_mouse_path,
     wind_mouse,
+    wind_mouse_batch,
 )
 
 
@@ -41,6 +43,23 @@ class TestWindMouse:
             assert isinstance(x, int)
             assert isinstance(y, int)
 
+    def test_wind_mouse_numpy_inputs_yield_python_ints(self):
+        """Test that NumPy scalar inputs still produce plain int points."""
+        path = list(
+            wind_mouse(
+                np.int64(0),
+                np.int32(0),
+                np.int64(100),
+                np.float64(100),
+                gravity_magnitude=np.float64(9),
+            )
+        )
+
+        assert len(path) > 0
+        for x, y in path:
+            assert type(x) is int
+            assert type(y) is int
+
     def test_wind_mouse_short_distance(self):
         """Test wind_mouse with very short distance."""
         # Very short distance (less than 1 pixel) should generate minimal path
@@ -88,23 +107,50 @@ class TestWindMouse:
 
     def test_wind_mouse_determinism(self):
         """Test that wind_mouse produces different paths (non-deterministic)."""
-        np.random.seed(42)
         path1 = list(
             wind_mouse(
-                Coordinate(0), Coordinate(0), Coordinate(100), Coordinate(100)
+                Coordinate(0),
+                Coordinate(0),
+                Coordinate(100),
+                Coordinate(100),
+                seed=42,
             )
         )
 
-        np.random.seed(43)
         path2 = list(
             wind_mouse(
-                Coordinate(0), Coordinate(0), Coordinate(100), Coordinate(100)
+                Coordinate(0),
+                Coordinate(0),
+                Coordinate(100),
+                Coordinate(100),
+                seed=43,
             )
         )
 
         # Paths should be different (randomness)
         assert path1 != path2
 
+    def test_wind_mouse_seed_reproduces_path(self):
+        """Test that the seed argument makes paths reproducible."""
+        args = (Coordinate(0), Coordinate(0), Coordinate(500), Coordinate(500))
+
+        path1 = list(wind_mouse(*args, seed=1))
+        path2 = list(wind_mouse(*args, seed=1))
+        path3 = list(wind_mouse(*args, seed=2))
+
+        assert path1 == path2
+        assert path1 != path3
+
+    def test_wind_mouse_rejects_out_of_range_seed(self):
+        """Test that seeds outside [0, 2**32) raise ValueError."""
+        args = (Coordinate(0), Coordinate(0), Coordinate(500), Coordinate(500))
+
+        for seed in (-1, 2**32, 2**70):
+            with pytest.raises(ValueError, match="seed must be in range"):
+                list(wind_mouse(*args, seed=seed))
+
+        assert list(wind_mouse(*args, seed=2**32 - 1))
+
     def test_wind_mouse_horizontal_movement(self):
         """Test wind_mouse with purely horizontal movement."""
         path = list(
@@ -130,6 +176,110 @@ class TestWindMouse:
         assert abs(last_y - 100) <= 1
 
 
+# The pure-Python body that runs when numba is not installed
+_wind_mouse_path_python = getattr(
+    _wind_mouse_path, "py_func", _wind_mouse_path
+)
+
+
+class TestWindMousePathFallback:
+    """Test the uncompiled _wind_mouse_path used without numba."""
+
+    def test_fallback_reaches_destination(self):
+        """Test that the Python fallback path ends near the destination."""
+        path = _wind_mouse_path_python(
+            0.0, 0.0, 300.0, -200.0, 9.0, 3.0, 15.0, 12.0, -1
+        )
+
+        assert len(path) > 0
+        for x, y in path:
+            assert type(x) is int
+            assert type(y) is int
+        last_x, last_y = path[-1]
+        assert abs(last_x - 300) <= 1
+        assert abs(last_y + 200) <= 1
+
+    def test_fallback_seed_reproduces_path(self):
+        """Test that seeding the Python fallback reproduces the path."""
+        args = (0.0, 0.0, 500.0, 500.0, 9.0, 3.0, 15.0, 12.0)
+
+        path1 = _wind_mouse_path_python(*args, 7)
+        path2 = _wind_mouse_path_python(*args, 7)
+
+        assert path1 == path2
+
+    def test_fallback_small_max_step(self):
+        """Test the fallback when max_step drops below 3 near the target."""
+        path = _wind_mouse_path_python(
+            0.0, 0.0, 100.0, 100.0, 9.0, 3.0, 2.0, 12.0, 3
+        )
+
+        last_x, last_y = path[-1]
+        assert abs(last_x - 100) <= 1
+        assert abs(last_y - 100) <= 1
+
+
+class TestWindMouseBatch:
+    """Test the batched wind_mouse_batch algorithm."""
+
+    def test_batch_reaches_destinations(self):
+        """Test that every path in the batch ends near its destination."""
+        starts = [(0, 0), (50, 50), (-50, -50)]
+        dests = [(100, 100), (150, 200), (50, 50)]
+
+        paths = wind_mouse_batch(starts, dests)
+
+        assert len(paths) == 3
+        for path, (dest_x, dest_y) in zip(paths, dests):
+            assert path.dtype == np.int32
+            assert path.ndim == 2 and path.shape[1] == 2
+            assert len(path) > 0
+            last_x, last_y = path[-1]
+            assert abs(last_x - dest_x) <= 1
+            assert abs(last_y - dest_y) <= 1
+
+    def test_batch_lane_already_at_destination(self):
+        """Test that a lane starting at its destination yields no points."""
+        paths = wind_mouse_batch([(10, 10), (0, 0)], [(10, 10), (100, 0)])
+
+        assert paths[0].shape == (0, 2)
+        assert len(paths[1]) > 0
+
+    def test_batch_is_reproducible_with_rng(self):
+        """Test that passing seeded generators gives identical paths."""
+        starts = [(0, 0), (20, 30)]
+        dests = [(100, 100), (300, 40)]
+
+        paths1 = wind_mouse_batch(starts, dests, rng=np.random.default_rng(42))
+        paths2 = wind_mouse_batch(starts, dests, rng=np.random.default_rng(42))
+
+        for path1, path2 in zip(paths1, paths2):
+            np.testing.assert_array_equal(path1, path2)
+
+    def test_batch_is_reproducible_with_seed(self):
+        """Test that the seed argument makes batch paths reproducible."""
+        starts = [(0, 0), (20, 30)]
+        dests = [(100, 100), (300, 40)]
+
+        paths1 = wind_mouse_batch(starts, dests, seed=42)
+        paths2 = wind_mouse_batch(starts, dests, seed=42)
+
+        for path1, path2 in zip(paths1, paths2):
+            np.testing.assert_array_equal(path1, path2)
+
+    def test_batch_seed_and_rng_conflict(self):
+        """Test that passing both seed and rng raises ValueError."""
+        with pytest.raises(ValueError, match="cannot be given together"):
+            wind_mouse_batch(
+                [(0, 0)], [(10, 10)], seed=1, rng=np.random.default_rng(1)
+            )
+
+    def test_batch_shape_mismatch(self):
+        """Test that mismatched starts and dests raise ValueError."""
+        with pytest.raises(ValueError, match="must both have shape"):
+            wind_mouse_batch([(0, 0), (1, 1)], [(10, 10)])
+
+
 class TestHoldMouseButton:
     """Test HoldMouseButton enum."""
 
@@ -289,7 +439,7 @@ class TestAbstractMouseController:
         )
 
         with pytest.raises(
-            ValueError, match="Destination coordinates must be set"
+            ValueError, match="must be set before computing the path"
         ):
             controller.tick()
 
@@ -305,8 +455,8 @@ class TestAbstractMouseController:
         result = controller.tick()
         assert result is True
 
-    def test_changing_destination_recreates_generator(self):
-        """Test that changing destination recreates the path generator."""
+    def test_changing_destination_recomputes_path(self):
+        """Test that changing destination recomputes the path."""
         controller = MockMouseController(
             start_x=Coordinate(0),
             start_y=Coordinate(0),
@@ -338,16 +488,39 @@ class TestAbstractMouseController:
 
         # Modifying start should trigger regeneration
         controller.start_x = Coordinate(10)
-        assert controller._create_generator is True
+        assert controller._create_path is True
 
-        controller._create_generator = False
+        controller._create_path = False
         controller.start_y = Coordinate(10)
-        assert controller._create_generator is True
+        assert controller._create_path is True
 
-        controller._create_generator = False
+        controller._create_path = False
         controller.dest_x = Coordinate(60)
-        assert controller._create_generator is True
+        assert controller._create_path is True
 
-        controller._create_generator = False
+        controller._create_path = False
         controller.dest_y = Coordinate(60)
-        assert controller._create_generator is True
+        assert controller._create_path is True
+
+    def test_path_is_precomputed_on_first_tick(self):
+        """Test that the whole path is computed once as a list of points."""
+        controller = MockMouseController(
+            start_x=Coordinate(0),
+            start_y=Coordinate(0),
+            dest_x=Coordinate(50),
+            dest_y=Coordinate(50),
+        )
+
+        controller.tick()
+        path = controller._path
+
+        assert isinstance(path, list)
+        assert all(type(x) is int and type(y) is int for x, y in path)
+        assert controller._idx == 1
+        assert controller.move_calls[0][:2] == path[0]
+
+        while controller.tick():
+            pass
+
+        assert controller._path is path
+        assert controller._idx == len(path)
@@ -17,6 +17,7 @@ class TestPackageImports:
         import windmouse.core
 
         assert hasattr(windmouse.core, "wind_mouse")
+        assert hasattr(windmouse.core, "wind_mouse_batch")
         assert hasattr(windmouse.core, "AbstractMouseController")
         assert hasattr(windmouse.core, "HoldMouseButton")
         assert hasattr(windmouse.core, "Coordinate")
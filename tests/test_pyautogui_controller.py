@@ -62,6 +62,23 @@ class TestPyautoguiMouseController:
         assert x == 150
         assert y == 250
 
+    @patch("windmouse.pyautogui_controller.pyautogui")
+    def test_start_position_uses_single_query(self, mock_pyautogui):
+        """Test that a missing start position is read with one call."""
+        from windmouse.core import Coordinate
+        from windmouse.pyautogui_controller import PyautoguiMouseController
+
+        mock_pyautogui.position.return_value = Mock(x=150, y=250)
+
+        controller = PyautoguiMouseController(
+            dest_x=Coordinate(300), dest_y=Coordinate(300)
+        )
+
+        controller.tick()
+
+        assert controller.start_position == (150, 250)
+        mock_pyautogui.position.assert_called_once_with()
+
     @patch("windmouse.pyautogui_controller.pyautogui")
     def test_hold_mouse_button(self, mock_pyautogui):
         """Test holding mouse button."""